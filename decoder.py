@@ -1,25 +1,77 @@
 """Core hex decoding logic."""
+import os
 import re
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 
-from models import Replacement
+from models import Replacements
+
+try:
+    import re2  # Optional: Google RE2, a DFA engine with linear-time matching
+except ImportError:
+    re2 = None
 
 
 # Detect runs of hex bytes like "65 68 6F ..." possibly spanning whitespace/newlines.
-# {3,} avoids false positives; change to {1,} if you want to decode very short runs too.
-HEX_RUN = re.compile(r'(?:\b[0-9A-Fa-f]{2}\b(?:\s+|$)){3,}', re.MULTILINE)
+# {2,} extra pairs (3+ total) avoids false positives; change to {0,} if you want to
+# decode very short runs too.
+# Every pair after the first must be preceded by whitespace, so each position can only
+# be consumed one way and the engine never has to backtrack through the alternation of
+# the old "(?:pair(?:\s+|$)){3,}" form; matches are identical.
+HEX_RUN = re.compile(r'\b[0-9A-Fa-f]{2}(?:\s+[0-9A-Fa-f]{2}){2,}(?:\s+|$)', re.MULTILINE)
+
+# RE2's \s leaves out \v and \x1c-\x1f, which Python's \s matches, so spell the class
+# out; on ASCII text this pattern matches exactly what HEX_RUN does.
+_ASCII_WS = r'[\t\n\x0b\x0c\r\x1c-\x1f ]'
+_HEX_RUN_DFA = re2.compile(
+    r'(?m)\b[0-9A-Fa-f]{2}(?:' + _ASCII_WS + r'+[0-9A-Fa-f]{2}){2,}(?:' + _ASCII_WS + r'+|$)'
+) if re2 is not None else None
+
+# ASCII inputs at least this long are scanned with RE2 when it is installed. Its
+# per-match overhead is higher than re's, so it only pays off on large pastes.
+DFA_THRESHOLD = 1024 * 1024
+
+# Inputs at least this long are scanned in worker processes. Below it, process start-up
+# and pickling the results back cost more than the single-threaded scan.
+PARALLEL_THRESHOLD = 4 * 1024 * 1024
+
+# Window size used by decode_text_stream
+STREAM_CHUNK_SIZE = 64 * 1024
 
+# A chunk may start right after a non-hex character when the next character is neither
+# hex nor whitespace: no run can cross that point, and no run can end at the chunk edge
+# that wouldn't also end there in the full text.
+_SAFE_SPLIT = re.compile(r'[^0-9A-Fa-f](?=[^0-9A-Fa-f\s])')
 
-def _decode_hex_bytes(byte_tokens: List[str]) -> str:
-    """Decode a list of hex byte tokens to UTF-8 string."""
-    hx = "".join(byte_tokens)
+
+def _iter_hex_runs(text: str):
+    """Iterate over HEX_RUN matches in text, using RE2 for large ASCII inputs if available."""
+    if _HEX_RUN_DFA is not None and len(text) >= DFA_THRESHOLD and text.isascii():
+        return _HEX_RUN_DFA.finditer(text)
+    return HEX_RUN.finditer(text)
+
+
+def _decode_match(m: "re.Match") -> Optional[Tuple[str, str, int]]:
+    """Decode a single HEX_RUN match into (hex run, decoded text, byte count), or None if it decodes to nothing."""
+    run = m.group(0)
+    # Strip trailing whitespace from the match to preserve spaces after hex sequences
+    run_stripped = run.rstrip()
+    trailing_ws = run[len(run_stripped):] if len(run_stripped) < len(run) else ""
+    
     try:
-        return bytes.fromhex(hx).decode("utf-8", errors="replace")
-    except Exception:
-        return ""
+        # bytes.fromhex skips the ASCII whitespace between pairs itself and converts at
+        # a couple of GB/s, so long runs need no separate vectorised path
+        raw = bytes.fromhex(run_stripped)
+    except ValueError:
+        # \s also matches non-ASCII whitespace (e.g. NBSP), which fromhex rejects
+        raw = bytes.fromhex("".join(run_stripped.split()))
+    decoded = raw.decode("utf-8", errors="replace")
+    if not decoded:
+        return None
+    # Preserve trailing whitespace after decoded text
+    return run, decoded + trailing_ws, len(raw)
 
 
-def find_replacements(text: str) -> List[Replacement]:
+def find_replacements(text: str) -> Replacements:
     """
     Find all hex byte sequences in text and return replacement information.
     
@@ -27,31 +79,31 @@ def find_replacements(text: str) -> List[Replacement]:
         text: Input text that may contain hex byte sequences
         
     Returns:
-        List of Replacement objects containing position and decoded information
+        Replacements containing position and decoded information
     """
-    reps: List[Replacement] = []
-    for m in HEX_RUN.finditer(text):
-        run = m.group(0)
-        # Strip trailing whitespace from the match to preserve spaces after hex sequences
-        run_stripped = run.rstrip()
-        trailing_ws = run[len(run_stripped):] if len(run_stripped) < len(run) else ""
-        
-        tokens = re.findall(r"\b[0-9A-Fa-f]{2}\b", run_stripped)
-        decoded = _decode_hex_bytes(tokens)
-        if decoded:
-            # Preserve trailing whitespace after decoded text
-            decoded_with_spaces = decoded + trailing_ws
-            reps.append(Replacement(m.start(), m.end(), run, decoded_with_spaces))
-    return reps
+    return _scan_chunk(text)[0]
 
 
-def apply_replacements(text: str, reps: List[Replacement]) -> str:
+def _scan_chunk(text: str) -> Tuple[Replacements, int]:
+    """Find replacements in text and also return the number of hex bytes they decode."""
+    reps = Replacements()
+    total_bytes = 0
+    for m in _iter_hex_runs(text):
+        decoded = _decode_match(m)
+        if decoded is not None:
+            run, decoded_run, num_bytes = decoded
+            reps.append(m.start(), m.end(), run, decoded_run)
+            total_bytes += num_bytes
+    return reps, total_bytes
+
+
+def apply_replacements(text: str, reps: Replacements) -> str:
     """
     Apply replacements to text, converting hex sequences to decoded text.
     
     Args:
         text: Original text
-        reps: List of replacements to apply
+        reps: Replacements to apply
         
     Returns:
         Text with hex sequences replaced by decoded text
@@ -59,11 +111,73 @@ def apply_replacements(text: str, reps: List[Replacement]) -> str:
     if not reps:
         return text
 
-    # Apply from end to start to keep indices valid.
-    out = text
-    for r in reversed(reps):
-        out = out[:r.start] + r.decoded + out[r.end:]
-    return out
+    # Stitch unchanged slices and decoded runs together in one pass instead of
+    # rebuilding the whole string once per replacement.
+    parts = []
+    cursor = 0
+    for start, end, decoded in sorted(zip(reps.starts, reps.ends, reps.decodeds)):
+        parts.append(text[cursor:start])
+        parts.append(decoded)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
+
+
+def _split_points(text: str, parts: int) -> List[int]:
+    """
+    Pick chunk boundaries for scanning text in pieces.
+    
+    Args:
+        text: Input text to split
+        parts: Desired number of chunks
+        
+    Returns:
+        Ascending offsets starting with 0 and ending with len(text); fewer than
+        parts chunks are produced when the text has too few safe split points
+    """
+    size = max(len(text) // parts, 1)
+    bounds = [0]
+    pos = size
+    while pos < len(text) and len(bounds) < parts:
+        m = _SAFE_SPLIT.search(text, pos)
+        if m is None:
+            break
+        bounds.append(m.end())
+        pos = m.end() + size
+    bounds.append(len(text))
+    return bounds
+
+
+def _find_replacements_parallel(text: str, workers: int) -> Tuple[Replacements, int]:
+    """
+    Scan chunks of text for replacements in worker processes.
+    
+    Args:
+        text: Input text that may contain hex byte sequences
+        workers: Number of worker processes (and chunks) to use
+        
+    Returns:
+        Tuple of the Replacements, with positions relative to the full text, and
+        the total number of hex bytes they decode
+    """
+    bounds = _split_points(text, workers)
+    if len(bounds) <= 2:
+        return _scan_chunk(text)
+    
+    # Imported here: it pulls in multiprocessing, which only very large pastes need
+    from concurrent.futures import ProcessPoolExecutor
+    
+    chunks = [text[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        results = list(executor.map(_scan_chunk, chunks))
+    
+    # Shift chunk-relative positions back onto the full text
+    reps = Replacements()
+    total_bytes = 0
+    for base, (chunk_reps, chunk_bytes) in zip(bounds, results):
+        reps.extend(chunk_reps, offset=base)
+        total_bytes += chunk_bytes
+    return reps, total_bytes
 
 
 def decode_text(text: str):
@@ -78,13 +192,64 @@ def decode_text(text: str):
     """
     from models import DecodeResult
     
-    reps = find_replacements(text)
-    decoded_str = apply_replacements(text, reps)
+    workers = os.cpu_count() or 1
+    if len(text) >= PARALLEL_THRESHOLD and workers > 1:
+        # Very large pastes: runs are independent, so scan chunks on every core
+        reps, total_bytes = _find_replacements_parallel(text, workers)
+        decoded_str = apply_replacements(text, reps)
+        total_chars = sum(map(len, reps.decodeds))
+    else:
+        # Find and apply replacements (and tally the stats) in the same scan so the
+        # text is only walked once
+        reps = Replacements()
+        parts = []
+        cursor = 0
+        total_bytes = 0
+        total_chars = 0
+        for m in _iter_hex_runs(text):
+            decoded = _decode_match(m)
+            if decoded is None:
+                continue
+            run, decoded_run, num_bytes = decoded
+            start, end = m.span()
+            reps.append(start, end, run, decoded_run)
+            parts.append(text[cursor:start])
+            parts.append(decoded_run)
+            cursor = end
+            total_bytes += num_bytes
+            total_chars += len(decoded_run)
+        parts.append(text[cursor:])
+        decoded_str = "".join(parts)
     
     return DecodeResult(
         original=text,
         decoded=decoded_str,
         replacements=reps,
-        num_replacements=len(reps)
+        num_replacements=len(reps),
+        total_hex_bytes=total_bytes,
+        total_decoded_chars=total_chars
     )
 
+
+def decode_text_stream(text: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator["DecodeResult"]:
+    """
+    Decode text one window at a time instead of all at once.
+    
+    Windows end at the first safe split point after chunk_size characters, so no hex
+    run is ever cut in two. Callers that only need per-window output (e.g. a preview)
+    never hold the full decoded text and replacement list at once.
+    
+    Args:
+        text: Input text that may contain hex byte sequences
+        chunk_size: Approximate number of characters per window
+        
+    Yields:
+        DecodeResult for each window; positions are relative to that window's original text
+    """
+    start = 0
+    while start < len(text):
+        m = _SAFE_SPLIT.search(text, start + chunk_size) if start + chunk_size < len(text) else None
+        # Without a safe split point the rest of the text has to be decoded in one go
+        end = m.end() if m is not None else len(text)
+        yield decode_text(text[start:end])
+        start = end
@@ -1,82 +1,183 @@
 """History management for storing and retrieving decode history."""
 import json
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
-from models import Replacement, HistoryEntry
+from models import Replacements, HistoryEntry
 
-# History database file
-HISTORY_FILE = "talos_history.json"
+try:
+    import orjson  # Optional: much faster JSON encode/decode for large histories
+except ImportError:
+    orjson = None
+
+# History database file (JSON Lines: one entry per line so saves can append)
+HISTORY_FILE = "talos_history.jsonl"
+# Pre-JSON-Lines history file, migrated on first load
+LEGACY_HISTORY_FILE = "talos_history.json"
 MAX_HISTORY_ENTRIES = 1000
+# Appends let the file run this far past the limit before it is trimmed back to
+# MAX_HISTORY_ENTRIES, so a full history isn't rewritten on every save
+PRUNE_THRESHOLD = MAX_HISTORY_ENTRIES + MAX_HISTORY_ENTRIES // 10
+
+# Parsed history keyed on the file's (mtime_ns, size), so repeated loads skip the JSON parse
+_cache = {"key": None, "data": None}
+# Line count keyed the same way, for get_history_count when nothing is parsed yet
+_count_cache = {"key": None, "count": 0}
+
+
+def _dumps(data) -> str:
+    """Serialize one history record to a single JSON line (without the newline)."""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _loads(text: str):
+    """Parse JSON text; raises json.JSONDecodeError (orjson's error subclasses it)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _file_key() -> Optional[Tuple[int, int]]:
+    """Return the (mtime_ns, size) of the history file, or None if it is missing."""
+    try:
+        st = os.stat(HISTORY_FILE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_legacy_history() -> List[HistoryEntry]:
+    """
+    Migrate the old single-document JSON history file to JSON Lines.
+    
+    Returns:
+        List of HistoryEntry objects read from the legacy file
+    """
+    try:
+        with open(LEGACY_HISTORY_FILE, 'r', encoding='utf-8') as f:
+            history = [HistoryEntry.from_dict(entry) for entry in _loads(f.read())]
+    except (json.JSONDecodeError, IOError):
+        return []
+    
+    save_history(history)
+    return history
 
 
 def load_history() -> List[HistoryEntry]:
     """
-    Load history from JSON file.
+    Load history from JSON Lines file.
     
     Returns:
         List of HistoryEntry objects
     """
-    if not os.path.exists(HISTORY_FILE):
+    key = _file_key()
+    if key is None:
+        if os.path.exists(LEGACY_HISTORY_FILE):
+            return _load_legacy_history()
         return []
     
+    if _cache["key"] == key:
+        # Return a copy so callers can sort/pop without touching the cache
+        return list(_cache["data"])
+    
+    history = []
     try:
-        with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return [HistoryEntry.from_dict(entry) for entry in data]
-    except (json.JSONDecodeError, IOError):
+        # A half-written line may end mid-character; replace it so the line just fails to parse
+        with open(HISTORY_FILE, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    history.append(HistoryEntry.from_dict(_loads(line)))
+                except json.JSONDecodeError:
+                    continue  # Skip a line left half-written by an interrupted save
+    except IOError:
         return []
+    
+    # Appends never trim, so prune old entries here once the file has grown past the slack
+    if len(history) > PRUNE_THRESHOLD:
+        history = history[-MAX_HISTORY_ENTRIES:]
+        save_history(history)
+    else:
+        _cache["key"] = key
+        _cache["data"] = history
+    
+    return list(history)
 
 
 def save_history(history: List[HistoryEntry]) -> None:
     """
-    Save history to JSON file.
+    Rewrite the whole history file.
     
     Args:
         history: List of HistoryEntry objects to save
     """
+    tmp_file = HISTORY_FILE + ".tmp"
     try:
-        data = [entry.to_dict() for entry in history]
-        with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-    except IOError:
-        pass  # Silently fail if we can't write
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            for entry in history:
+                f.write(_dumps(entry.to_dict()) + "\n")
+        # Replace atomically so a failed write never truncates the existing history
+        os.replace(tmp_file, HISTORY_FILE)
+    except (IOError, OSError):
+        return  # Silently fail if we can't write
+    
+    # We already hold what was written, so the next load doesn't need to re-read it
+    _cache["key"] = _file_key()
+    _cache["data"] = list(history)
 
 
-def add_to_history(original: str, decoded: str, replacements: List[Replacement]) -> None:
+def add_to_history(original: str, decoded: str, replacements: Replacements) -> None:
     """
     Add a new entry to history.
     
     Args:
         original: Original text
         decoded: Decoded text
-        replacements: List of replacements that were applied
+        replacements: Replacements that were applied
     """
-    history = load_history()
-    
     entry = HistoryEntry(
         timestamp=datetime.now().isoformat(),
         original=original,
         decoded=decoded,
         num_replacements=len(replacements),
+        # Zip the columns straight into packed rows without building Replacement objects
         replacements=[
-            {
-                "hex_run": r.hex_run,
-                "decoded": r.decoded,
-                "start": r.start,
-                "end": r.end
-            }
-            for r in replacements
+            list(row) for row in
+            zip(replacements.starts, replacements.ends, replacements.hex_runs, replacements.decodeds)
         ]
     )
     
-    history.append(entry)
-    # Keep only last MAX_HISTORY_ENTRIES entries to prevent file from growing too large
-    if len(history) > MAX_HISTORY_ENTRIES:
-        history = history[-MAX_HISTORY_ENTRIES:]
+    if not os.path.exists(HISTORY_FILE) and os.path.exists(LEGACY_HISTORY_FILE):
+        load_history()  # Migrate the legacy file before appending to the new one
     
-    save_history(history)
+    # Append a single line instead of rewriting the whole file; load_history
+    # prunes to MAX_HISTORY_ENTRIES once the file grows past PRUNE_THRESHOLD
+    key_before = _file_key()
+    line = _dumps(entry.to_dict()) + "\n"
+    try:
+        with open(HISTORY_FILE, 'a+b') as f:
+            # Terminate a line left half-written by an interrupted save, so only
+            # that line is skipped on load rather than this entry along with it
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode('utf-8'))
+    except IOError:
+        return  # Silently fail if we can't write
+    
+    if (key_before is not None and _cache["key"] == key_before
+            and len(_cache["data"]) < PRUNE_THRESHOLD):
+        # The cache matched the file we appended to, so extend it rather than re-read
+        _cache["data"].append(entry)
+        _cache["key"] = _file_key()
+    else:
+        # Force the next load to re-read (and prune, if the threshold was passed)
+        _cache["key"] = None
 
 
 def delete_history_entry(entry: HistoryEntry) -> bool:
@@ -104,6 +205,38 @@ def delete_history_entry(entry: HistoryEntry) -> bool:
 
 
 def get_history_count() -> int:
-    """Get the number of history entries."""
-    return len(load_history())
+    """
+    Get the number of history entries.
+    
+    Uses the parsed history when it is cached, otherwise counts complete-looking lines
+    (one per entry) without parsing any JSON. Blank lines and lines cut off by an
+    interrupted save are not counted, but a line that is corrupt in some other way
+    still is, so without a cache the result is an upper bound on what load_history
+    returns.
+    
+    Returns:
+        Number of history entries
+    """
+    key = _file_key()
+    if key is None:
+        # Nothing to count yet, or a legacy file that loading will migrate
+        return len(load_history())
+    if _cache["key"] == key:
+        return len(_cache["data"])
+    if _count_cache["key"] == key:
+        return _count_cache["count"]
+    
+    try:
+        with open(HISTORY_FILE, 'rb') as f:
+            # Every entry is a JSON object, so a line not ending in "}" is blank or truncated
+            count = sum(1 for line in f if line.rstrip().endswith(b"}"))
+    except IOError:
+        return 0
+    
+    # load_history prunes back to the limit on its next read once past the threshold
+    if count > PRUNE_THRESHOLD:
+        count = MAX_HISTORY_ENTRIES
+    _count_cache["key"] = key
+    _count_cache["count"] = count
+    return count
 
@@ -4,7 +4,9 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Button, Header, Footer, Static, TextArea, Label
 from textual.screen import Screen
 
-from ui.screens import MainMenuScreen
+# Import the menu directly rather than via ui.screens, which would also load every
+# other screen; those are imported on first use by the menu's actions
+from ui.main_menu_screen import MainMenuScreen
 
 
 class TalosDecoderApp(App):
@@ -1,35 +1,82 @@
-"""Data models for the Talos Decoder application."""
-from dataclasses import dataclass
-from typing import Dict, Any, List
+"""Data models for the Talos Decoder application.
+
+Replacement, DecodeResult and HistoryEntry declare __slots__ (spelled out rather than
+@dataclass(slots=True), which needs Python 3.10) so their instances carry no __dict__,
+which matters most for the up to MAX_HISTORY_ENTRIES HistoryEntry objects kept loaded.
+Replacements stores its runs as parallel lists instead of one object per run.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterator, List
 
 
 @dataclass
 class Replacement:
     """Represents a hex byte sequence replacement."""
+    __slots__ = ('start', 'end', 'hex_run', 'decoded')
+    
     start: int
     end: int
     hex_run: str
     decoded: str
 
 
+@dataclass
+class Replacements:
+    """
+    Column-oriented (structure-of-arrays) collection of replacements.
+    
+    Offsets and strings are kept in parallel lists instead of one Replacement object
+    per run, so large decodes allocate four lists rather than thousands of objects.
+    Iterating still yields Replacement objects for code that wants them.
+    """
+    starts: List[int] = field(default_factory=list)
+    ends: List[int] = field(default_factory=list)
+    hex_runs: List[str] = field(default_factory=list)
+    decodeds: List[str] = field(default_factory=list)
+    
+    @classmethod
+    def from_rows(cls, rows: List[List[Any]]) -> 'Replacements':
+        """Create Replacements from packed [start, end, hex_run, decoded] rows (the HistoryEntry format)."""
+        if not rows:
+            return cls()
+        starts, ends, hex_runs, decodeds = (list(column) for column in zip(*rows))
+        return cls(starts, ends, hex_runs, decodeds)
+    
+    def append(self, start: int, end: int, hex_run: str, decoded: str) -> None:
+        """Add one replacement."""
+        self.starts.append(start)
+        self.ends.append(end)
+        self.hex_runs.append(hex_run)
+        self.decodeds.append(decoded)
+    
+    def extend(self, other: 'Replacements', offset: int = 0) -> None:
+        """Add all replacements from other, shifting their positions by offset."""
+        self.starts.extend([s + offset for s in other.starts] if offset else other.starts)
+        self.ends.extend([e + offset for e in other.ends] if offset else other.ends)
+        self.hex_runs.extend(other.hex_runs)
+        self.decodeds.extend(other.decodeds)
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def __iter__(self) -> Iterator[Replacement]:
+        for start, end, hex_run, decoded in zip(self.starts, self.ends, self.hex_runs, self.decodeds):
+            yield Replacement(start, end, hex_run, decoded)
+
+
 @dataclass
 class DecodeResult:
     """Result of decoding text containing hex sequences."""
+    __slots__ = ('original', 'decoded', 'replacements', 'num_replacements',
+                 'total_hex_bytes', 'total_decoded_chars')
+    
     original: str
     decoded: str
-    replacements: List[Replacement]
+    replacements: Replacements
     num_replacements: int
-    
-    @property
-    def total_hex_bytes(self) -> int:
-        """Calculate total number of hex bytes decoded."""
-        import re
-        return sum(len(re.findall(r"\b[0-9A-Fa-f]{2}\b", r.hex_run)) for r in self.replacements)
-    
-    @property
-    def total_decoded_chars(self) -> int:
-        """Calculate total number of decoded characters."""
-        return sum(len(r.decoded) for r in self.replacements)
+    # Tallied by decode_text during its scan so reading them is O(1)
+    total_hex_bytes: int
+    total_decoded_chars: int
     
     @property
     def avg_bytes_per_run(self) -> float:
@@ -42,21 +89,31 @@ class DecodeResult:
 @dataclass
 class HistoryEntry:
     """Represents a history entry."""
+    __slots__ = ('timestamp', 'original', 'decoded', 'num_replacements', 'replacements')
+    
     timestamp: str
     original: str
     decoded: str
     num_replacements: int
-    replacements: List[Dict[str, Any]]
+    # Packed as [start, end, hex_run, decoded] rows to keep the stored JSON small
+    replacements: List[List[Any]]
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'HistoryEntry':
         """Create HistoryEntry from dictionary."""
+        replacements = data.get('replacements', [])
+        if replacements and isinstance(replacements[0], dict):
+            # Older history files stored each replacement as a dict
+            replacements = [
+                [r.get('start', 0), r.get('end', 0), r.get('hex_run', ''), r.get('decoded', '')]
+                for r in replacements
+            ]
         return cls(
             timestamp=data.get('timestamp', ''),
             original=data.get('original', ''),
             decoded=data.get('decoded', ''),
             num_replacements=data.get('num_replacements', 0),
-            replacements=data.get('replacements', [])
+            replacements=replacements
         )
     
     def to_dict(self) -> Dict[str, Any]:
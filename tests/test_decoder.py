@@ -0,0 +1,108 @@
+"""Tests for hex decoding, in particular the chunked and streaming scans."""
+import random
+import unittest
+from unittest import mock
+
+import decoder
+from models import Replacements
+
+# Pieces that make hex runs start, stop and touch each other in as many ways as possible
+_HEX_PAIRS = ["41", "6f", "E9", "00", "ff", "0a", "20"]
+_WHITESPACE = [" ", "  ", "\n", "\t", "\r\n", "\x0b", "\x1c", " ", " "]
+_OTHER = ["4", "a", "g", "x", "Z", "[", "]", ".", ":", "-", "_", "é", "hello"]
+
+
+def _random_text(rng: random.Random, ascii_only: bool = False) -> str:
+    """Build a random text mixing hex pairs, whitespace and other characters."""
+    pieces = []
+    for _ in range(rng.randint(0, 60)):
+        roll = rng.random()
+        if roll < 0.5:
+            pieces.append(rng.choice(_HEX_PAIRS))
+        elif roll < 0.8:
+            pieces.append(rng.choice(_WHITESPACE))
+        else:
+            pieces.append(rng.choice(_OTHER))
+    text = "".join(pieces)
+    if ascii_only:
+        text = text.encode('ascii', 'ignore').decode('ascii')
+    return text
+
+
+def _columns(reps: Replacements):
+    """Return the columns of reps as one comparable tuple."""
+    return (reps.starts, reps.ends, reps.hex_runs, reps.decodeds)
+
+
+class DecoderTests(unittest.TestCase):
+    """Check that every scan path agrees with the serial scan."""
+    
+    CASES = 2000
+    
+    def setUp(self):
+        self.rng = random.Random(1234)
+    
+    def test_decode_text_basic(self):
+        result = decoder.decode_text("say 48 69 21 now")
+        self.assertEqual(result.decoded, "say Hi! now")
+        self.assertEqual(result.num_replacements, 1)
+        self.assertEqual(result.total_hex_bytes, 3)
+    
+    def test_stream_matches_decode_text(self):
+        for _ in range(self.CASES):
+            text = _random_text(self.rng)
+            chunk_size = self.rng.randint(1, 20)
+            expected = decoder.decode_text(text)
+            windows = list(decoder.decode_text_stream(text, chunk_size=chunk_size))
+            
+            with self.subTest(text=text, chunk_size=chunk_size):
+                self.assertEqual("".join(w.original for w in windows), text)
+                self.assertEqual("".join(w.decoded for w in windows), expected.decoded)
+                self.assertEqual(sum(w.num_replacements for w in windows), expected.num_replacements)
+                self.assertEqual(sum(w.total_hex_bytes for w in windows), expected.total_hex_bytes)
+                self.assertEqual(sum(w.total_decoded_chars for w in windows), expected.total_decoded_chars)
+    
+    def test_chunked_scan_matches_serial_scan(self):
+        for _ in range(self.CASES):
+            text = _random_text(self.rng)
+            parts = self.rng.randint(2, 8)
+            expected_reps, expected_bytes = decoder._scan_chunk(text)
+            
+            bounds = decoder._split_points(text, parts)
+            reps = Replacements()
+            total_bytes = 0
+            for start, end in zip(bounds, bounds[1:]):
+                chunk_reps, chunk_bytes = decoder._scan_chunk(text[start:end])
+                reps.extend(chunk_reps, offset=start)
+                total_bytes += chunk_bytes
+            
+            with self.subTest(text=text, bounds=bounds):
+                self.assertEqual(bounds[0], 0)
+                self.assertEqual(bounds[-1], len(text))
+                self.assertEqual(_columns(reps), _columns(expected_reps))
+                self.assertEqual(total_bytes, expected_bytes)
+    
+    @unittest.skipIf(decoder._HEX_RUN_DFA is None, "re2 is not installed")
+    def test_dfa_pattern_matches_hex_run_on_ascii(self):
+        for _ in range(self.CASES):
+            text = _random_text(self.rng, ascii_only=True)
+            expected = [m.span() for m in decoder.HEX_RUN.finditer(text)]
+            
+            with self.subTest(text=text):
+                self.assertEqual([m.span() for m in decoder._HEX_RUN_DFA.finditer(text)], expected)
+    
+    @unittest.skipIf(decoder._HEX_RUN_DFA is None, "re2 is not installed")
+    def test_decode_text_with_dfa_matches_default(self):
+        for _ in range(self.CASES // 10):
+            text = _random_text(self.rng, ascii_only=True)
+            expected = decoder.decode_text(text)
+            with mock.patch.object(decoder, "DFA_THRESHOLD", 0):
+                result = decoder.decode_text(text)
+            
+            with self.subTest(text=text):
+                self.assertEqual(result.decoded, expected.decoded)
+                self.assertEqual(_columns(result.replacements), _columns(expected.replacements))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Tests for history storage."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import history
+from models import Replacements
+
+
+class HistoryFileTests(unittest.TestCase):
+    """Run each test against a fresh history file in a temporary directory."""
+    
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        history._cache.update(key=None, data=None)
+        history._count_cache.update(key=None, count=0)
+    
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+    
+    def test_append_after_truncated_line_keeps_new_entries(self):
+        history.add_to_history("first", "first", Replacements())
+        # Simulate a save interrupted partway through its line
+        with open(history.HISTORY_FILE, 'a', encoding='utf-8') as f:
+            f.write('{"timestamp":"2026-')
+        history.add_to_history("second", "second", Replacements())
+        history.add_to_history("third", "third", Replacements())
+        
+        history._cache.update(key=None, data=None)
+        self.assertEqual([e.original for e in history.load_history()], ["first", "second", "third"])
+    
+    def test_count_skips_truncated_and_blank_lines(self):
+        history.add_to_history("first", "first", Replacements())
+        with open(history.HISTORY_FILE, 'a', encoding='utf-8') as f:
+            f.write('{"timestamp":"2026-\n\n')
+        history.add_to_history("second", "second", Replacements())
+        
+        history._cache.update(key=None, data=None)
+        self.assertEqual(history.get_history_count(), 2)
+
+    
+    @mock.patch.object(history, "PRUNE_THRESHOLD", 11)
+    @mock.patch.object(history, "MAX_HISTORY_ENTRIES", 10)
+    def test_full_history_appends_until_prune_threshold(self):
+        for i in range(11):
+            history.add_to_history(str(i), str(i), Replacements())
+        with mock.patch.object(history, "save_history") as save:
+            self.assertEqual(len(history.load_history()), 11)
+            save.assert_not_called()
+        
+        history.add_to_history("11", "11", Replacements())
+        self.assertEqual([e.original for e in history.load_history()], [str(i) for i in range(2, 12)])
+        with open(history.HISTORY_FILE, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 """About screen displaying README content."""
 import os
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.containers import Vertical, VerticalScroll
 from textual.screen import Screen
@@ -7,6 +9,18 @@ from textual.widgets import Button, Static, Markdown
 from textual.binding import Binding
 
 
+@lru_cache(maxsize=1)
+def _load_readme() -> str:
+    """Read README.md once per process; the About screen reuses the text on every visit."""
+    readme_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "README.md")
+    
+    try:
+        with open(readme_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except IOError:
+        return "# Error\n\nCould not load README.md file."
+
+
 class AboutScreen(Screen):
     """About screen displaying README content with proper markdown rendering."""
     
@@ -52,15 +66,7 @@ class AboutScreen(Screen):
         
         # Scrollable content area with rendered markdown
         with VerticalScroll(id="content-scroll"):
-            readme_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "README.md")
-            
-            try:
-                with open(readme_path, 'r', encoding='utf-8') as f:
-                    readme_content = f.read()
-            except IOError:
-                readme_content = "# Error\n\nCould not load README.md file."
-            
-            yield Markdown(readme_content)
+            yield Markdown(_load_readme())
         
         # Footer with back button
         with Vertical(id="footer"):
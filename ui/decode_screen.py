@@ -9,7 +9,7 @@ from textual.screen import Screen
 from textual.widgets import Button, Static, TextArea
 from textual.binding import Binding
 
-from decoder import decode_text
+from decoder import decode_text, decode_text_stream
 from history import add_to_history
 from ui.formatters import format_text_with_highlights
 
@@ -168,9 +168,23 @@ class DecodeScreen(Screen):
             )
             return
         
-        result = decode_text(text)
-        
-        if not result.replacements:
+        # Decode window by window: the preview only needs the highlighted text and the
+        # counts, so the full decoded string and replacement list are never built
+        formatted_parts = []
+        num_replacements = 0
+        total_hex_bytes = 0
+        for chunk in decode_text_stream(text):
+            num_replacements += chunk.num_replacements
+            total_hex_bytes += chunk.total_hex_bytes
+            # Format with highlights - pass ORIGINAL text, not decoded
+            formatted_parts.append(format_text_with_highlights(
+                chunk.original,  # Use original text - positions refer to original
+                chunk.replacements,
+                highlight_hex=False,  # Show decoded portions in green
+                assume_sorted=True  # decode_text yields replacements in text order
+            ))
+        
+        if not num_replacements:
             output_widget.update(
                 "[yellow]No hex sequences detected.[/yellow]\n\n"
                 "[dim]Make sure your text contains hex byte sequences\n"
@@ -178,17 +192,12 @@ class DecodeScreen(Screen):
             )
             return
         
-        # Format with highlights - pass ORIGINAL text, not decoded
-        formatted = format_text_with_highlights(
-            result.original,  # Use original text - positions refer to original
-            result.replacements, 
-            highlight_hex=False  # Show decoded portions in green
-        )
+        formatted = "".join(formatted_parts)
         
         stats = (
             f"[bold cyan]╔══ DECODE RESULTS ══╗[/bold cyan]\n"
-            f"[bold cyan]║[/bold cyan] Detections: {result.num_replacements}\n"
-            f"[bold cyan]║[/bold cyan] Total bytes: {result.total_hex_bytes}\n"
+            f"[bold cyan]║[/bold cyan] Detections: {num_replacements}\n"
+            f"[bold cyan]║[/bold cyan] Total bytes: {total_hex_bytes}\n"
             f"[bold cyan]╚════════════════════╝[/bold cyan]\n\n"
         )
         
@@ -215,7 +224,8 @@ class DecodeScreen(Screen):
         formatted = format_text_with_highlights(
             result.original,  # Use original text - positions refer to original
             result.replacements, 
-            highlight_hex=False  # Show decoded portions in green
+            highlight_hex=False,  # Show decoded portions in green
+            assume_sorted=True  # decode_text yields replacements in text order
         )
         
         stats = (
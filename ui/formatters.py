@@ -1,7 +1,8 @@
 """Text formatting utilities for UI display."""
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
-from models import Replacement
+from models import Replacements
 
 
 def create_aligned_banner(title_lines: List[str], subtitle: str = "", width: int = 65) -> str:
@@ -67,14 +68,16 @@ def create_aligned_banner(title_lines: List[str], subtitle: str = "", width: int
     return "\n".join(lines)
 
 
-def format_text_with_highlights(original_text: str, reps: List[Replacement], highlight_hex: bool = True) -> str:
+def format_text_with_highlights(original_text: str, reps: Replacements, highlight_hex: bool = True,
+                                assume_sorted: bool = False) -> str:
     """
     Format text with Textual/Rich markup for highlighting hex sequences or decoded portions.
     
     Args:
         original_text: The ORIGINAL text (before decoding) to format
-        reps: List of replacements with positions in original text
+        reps: Replacements with positions in original text
         highlight_hex: If True, highlight hex runs in yellow; if False, highlight decoded text in green
+        assume_sorted: If True, reps are already in start order (as decode_text returns them)
         
     Returns:
         Formatted text with Textual/Rich markup
@@ -82,32 +85,35 @@ def format_text_with_highlights(original_text: str, reps: List[Replacement], hig
     if not reps:
         return original_text
     
-    # Sort replacements by start position
-    reps_sorted = sorted(reps, key=lambda x: x.start)
+    # Walk the (start, end, decoded) columns directly, sorted by start position
+    spans = zip(reps.starts, reps.ends, reps.decodeds)
+    if not assume_sorted:
+        spans = sorted(spans)
     
+    # One f-string segment per replacement (unchanged text + highlight) through a bound append
     result = []
+    append = result.append
     cursor = 0
     
-    for r in reps_sorted:
-        # Add text before this replacement (unchanged)
-        result.append(original_text[cursor:r.start])
-        
-        if highlight_hex:
-            # Show original hex with yellow highlight
-            result.append(f"[bold yellow]{original_text[r.start:r.end]}[/bold yellow]")
-        else:
-            # Show decoded text with green highlight
-            result.append(f"[bold green]{r.decoded}[/bold green]")
-        
-        cursor = r.end
+    if highlight_hex:
+        # Show original hex with yellow highlight
+        for start, end, _ in spans:
+            append(f"{original_text[cursor:start]}[bold yellow]{original_text[start:end]}[/bold yellow]")
+            cursor = end
+    else:
+        # Show decoded text with green highlight
+        for start, end, decoded in spans:
+            append(f"{original_text[cursor:start]}[bold green]{decoded}[/bold green]")
+            cursor = end
     
     # Add remaining text after last replacement
-    result.append(original_text[cursor:])
+    append(original_text[cursor:])
     
     return "".join(result)
 
 
-def format_decoded_text_with_highlights(decoded_text: str, original_text: str, reps: List[Replacement]) -> str:
+def format_decoded_text_with_highlights(decoded_text: str, original_text: str, reps: Replacements,
+                                        assume_sorted: bool = False) -> str:
     """
     Format decoded text with Textual/Rich markup highlighting the decoded portions in green.
     
@@ -117,7 +123,8 @@ def format_decoded_text_with_highlights(decoded_text: str, original_text: str, r
     Args:
         decoded_text: The decoded text (after replacements applied) - used for validation
         original_text: The original text (before decoding)
-        reps: List of replacements with positions in original text
+        reps: Replacements with positions in original text
+        assume_sorted: If True, reps are already in start order (as decode_text returns them)
         
     Returns:
         Formatted decoded text with decoded portions highlighted in green
@@ -125,28 +132,28 @@ def format_decoded_text_with_highlights(decoded_text: str, original_text: str, r
     if not reps:
         return decoded_text
     
-    # Sort replacements by start position in original text
-    reps_sorted = sorted(reps, key=lambda x: x.start)
+    # Walk the (start, end, decoded) columns directly, sorted by start position in original text
+    spans = zip(reps.starts, reps.ends, reps.decodeds)
+    if not assume_sorted:
+        spans = sorted(spans)
     
     # Build the formatted decoded text by applying replacements and highlighting
     result = []
+    append = result.append
     cursor = 0
     
-    for r in reps_sorted:
-        # Add text before this replacement (unchanged text)
-        result.append(original_text[cursor:r.start])
-        
-        # Add the decoded portion highlighted in green
-        result.append(f"[bold green]{r.decoded}[/bold green]")
-        
-        cursor = r.end
+    for start, end, decoded in spans:
+        # Unchanged text before this replacement, then the decoded portion highlighted in green
+        append(f"{original_text[cursor:start]}[bold green]{decoded}[/bold green]")
+        cursor = end
     
     # Add remaining text after last replacement
-    result.append(original_text[cursor:])
+    append(original_text[cursor:])
     
     return "".join(result)
 
 
+@lru_cache(maxsize=1024)
 def format_timestamp(timestamp: str) -> str:
     """
     Format ISO timestamp to readable format.
@@ -163,3 +170,50 @@ def format_timestamp(timestamp: str) -> str:
         return dt.strftime("%Y-%m-%d %H:%M:%S")
     except:
         return timestamp
+
+
+# Characters of text shown in a history table preview cell
+PREVIEW_WIDTH = 40
+
+
+def format_preview(text: str, width: int = PREVIEW_WIDTH) -> str:
+    """
+    Shorten text for a one-line preview, e.g. a history table cell.
+    
+    Args:
+        text: Text to shorten
+        width: Maximum number of characters kept before the ellipsis
+        
+    Returns:
+        text itself if it fits, otherwise its first width characters followed by "..."
+    """
+    # text[width:width + 1] is non-empty only when something was cut off
+    return text[:width] + ("..." if text[width:width + 1] else "")
+
+
+def format_history_row(timestamp: str, original: str, decoded: str, num_replacements: int) -> Tuple[str, str, str, str]:
+    """
+    Render all display cells of a history table row at once.
+    
+    Cached per entry, so reopening the history screen reuses the rendered strings.
+    
+    Args:
+        timestamp: ISO format timestamp string
+        original: Original input text
+        decoded: Decoded text
+        num_replacements: Number of hex runs decoded
+        
+    Returns:
+        Tuple of (time, original preview, decoded preview, detections) strings
+    """
+    # A preview only looks at the first PREVIEW_WIDTH + 1 characters, so key the cache on
+    # those instead of holding whole texts in it
+    head = PREVIEW_WIDTH + 1
+    return _format_history_row(timestamp, original[:head], decoded[:head], num_replacements)
+
+
+@lru_cache(maxsize=1024)
+def _format_history_row(timestamp: str, original_head: str, decoded_head: str,
+                        num_replacements: int) -> Tuple[str, str, str, str]:
+    """Cached body of format_history_row."""
+    return (format_timestamp(timestamp), format_preview(original_head), format_preview(decoded_head), str(num_replacements))
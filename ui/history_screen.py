@@ -1,4 +1,7 @@
 """History browser screens."""
+import heapq
+from operator import attrgetter
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.screen import Screen, ModalScreen
@@ -6,8 +9,35 @@ from textual.widgets import Button, Static, DataTable
 from textual.binding import Binding
 
 from history import load_history, delete_history_entry
-from ui.formatters import format_timestamp, format_text_with_highlights, format_decoded_text_with_highlights
-from models import Replacement
+from ui.formatters import (
+    format_timestamp, format_history_row, format_text_with_highlights, format_decoded_text_with_highlights
+)
+from models import Replacements
+
+# Number of most recent entries listed in the history table
+MAX_DISPLAYED_ENTRIES = 50
+
+
+def _build_rows(entries, _row=format_history_row):
+    """
+    Build the history table's (row key, cells) pairs.
+    
+    The formatter is bound as a default argument so the loop reads it as a local
+    rather than looking up a module global on every row.
+    
+    Args:
+        entries: HistoryEntry objects in display order
+        
+    Returns:
+        List of (row key, (time, original preview, decoded preview, detections)) tuples
+    """
+    rows = []
+    append = rows.append
+    for entry in entries:
+        timestamp = entry.timestamp
+        # Timestamps are already ISO strings, so they serve as row keys as-is
+        append((timestamp, _row(timestamp, entry.original, entry.decoded, entry.num_replacements)))
+    return rows
 
 
 class HistoryScreen(Screen):
@@ -42,6 +72,11 @@ class HistoryScreen(Screen):
         Binding("escape", "back", "Back"),
     ]
     
+    def __init__(self):
+        super().__init__()
+        # Displayed entries, newest first, loaded once in compose and reused by the actions
+        self._sorted_history = None
+    
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         history = load_history()
@@ -55,25 +90,18 @@ class HistoryScreen(Screen):
                 yield Button("Back", id="back", variant="default")
             return
         
-        # Sort by timestamp, newest first
-        history.sort(key=lambda x: x.timestamp, reverse=True)
+        # Only the newest entries are shown, so select them instead of sorting everything
+        self._sorted_history = heapq.nlargest(MAX_DISPLAYED_ENTRIES, history, key=attrgetter('timestamp'))
         
         yield Static("[bold]DECODING HISTORY[/bold]", classes="banner-container")
         
         table = DataTable(id="history-table")
         table.add_columns("Time", "Original Preview", "Decoded Preview", "Detections")
         
-        for entry in history[:50]:  # Show first 50
-            formatted_time = format_timestamp(entry.timestamp)
-            original_preview = entry.original[:40] + "..." if len(entry.original) > 40 else entry.original
-            decoded_preview = entry.decoded[:40] + "..." if len(entry.decoded) > 40 else entry.decoded
-            table.add_row(
-                formatted_time,
-                original_preview,
-                decoded_preview,
-                str(entry.num_replacements),
-                key=str(entry.timestamp)
-            )
+        # The table isn't mounted yet, so these adds trigger no refreshes. DataTable.add_rows
+        # is this same loop but can't take row keys, which remove_row relies on.
+        for key, cells in _build_rows(self._sorted_history):
+            table.add_row(*cells, key=key)
         
         yield table
         
@@ -93,11 +121,12 @@ class HistoryScreen(Screen):
     
     def view_details(self) -> None:
         """View selected entry details."""
+        if not self._sorted_history:
+            return  # Empty-history view: there is no table to select from
         table = self.query_one("#history-table", DataTable)
         if table.cursor_row is not None:
             # Get the selected entry
-            history = load_history()
-            history.sort(key=lambda x: x.timestamp, reverse=True)
+            history = self._sorted_history
             if table.cursor_row < len(history):
                 entry = history[table.cursor_row]
                 self.app.push_screen(HistoryDetailScreen(entry))
@@ -110,11 +139,34 @@ class HistoryScreen(Screen):
         """Show delete confirmation dialog."""
         table = self.query_one("#history-table", DataTable)
         if table.cursor_row is not None:
-            history = load_history()
-            history.sort(key=lambda x: x.timestamp, reverse=True)
+            history = self._sorted_history or []
             if table.cursor_row < len(history):
                 entry = history[table.cursor_row]
-                self.app.push_screen(DeleteConfirmScreen(entry, self))
+                
+                def on_closed(deleted: bool) -> None:
+                    if deleted:
+                        self.remove_row(entry)
+                
+                self.app.push_screen(DeleteConfirmScreen(entry), on_closed)
+    
+    def remove_row(self, entry) -> None:
+        """Drop a deleted entry from the table in place instead of rebuilding the screen."""
+        self._sorted_history.remove(entry)
+        if not self._sorted_history:
+            # Nothing left to list; rebuild to show the empty-history message
+            self.refresh(recompose=True)
+            return
+        
+        table = self.query_one("#history-table", DataTable)
+        table.remove_row(entry.timestamp)
+        
+        # Only a table cut off at MAX_DISPLAYED_ENTRIES has a next-newest entry to pull in
+        shown = len(self._sorted_history)
+        if shown == MAX_DISPLAYED_ENTRIES - 1:
+            newest = heapq.nlargest(MAX_DISPLAYED_ENTRIES, load_history(), key=attrgetter('timestamp'))
+            for key, cells in _build_rows(newest[shown:]):
+                table.add_row(*cells, key=key)
+            self._sorted_history.extend(newest[shown:])
     
     def action_back(self) -> None:
         """Go back to main menu."""
@@ -194,6 +246,9 @@ class HistoryDetailScreen(ModalScreen):
     def __init__(self, entry):
         super().__init__()
         self.entry = entry
+        # Unpack the stored [start, end, hex_run, decoded] rows into columns once (no
+        # per-run objects); both panels format from them
+        self.replacements = Replacements.from_rows(entry.replacements)
     
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -210,19 +265,9 @@ class HistoryDetailScreen(ModalScreen):
                 with Vertical(id="original-panel"):
                     yield Static("[bold cyan]═══ ORIGINAL ═══[/bold cyan]", classes="panel-title")
                     with ScrollableContainer(classes="content-scroll"):
-                        # Convert replacements dicts back to Replacement objects for formatting
-                        replacements = [
-                            Replacement(
-                                start=r.get('start', 0),
-                                end=r.get('end', 0),
-                                hex_run=r.get('hex_run', ''),
-                                decoded=r.get('decoded', '')
-                            )
-                            for r in self.entry.replacements
-                        ]
                         formatted_original = format_text_with_highlights(
                             self.entry.original,
-                            replacements,
+                            self.replacements,
                             highlight_hex=True  # Highlight hex in yellow
                         )
                         yield Static(formatted_original, classes="content-area")
@@ -231,21 +276,11 @@ class HistoryDetailScreen(ModalScreen):
                 with Vertical(id="decoded-panel"):
                     yield Static("[bold green]═══ DECODED ═══[/bold green]", classes="panel-title")
                     with ScrollableContainer(classes="content-scroll"):
-                        # Convert replacements dicts back to Replacement objects for formatting
-                        replacements = [
-                            Replacement(
-                                start=r.get('start', 0),
-                                end=r.get('end', 0),
-                                hex_run=r.get('hex_run', ''),
-                                decoded=r.get('decoded', '')
-                            )
-                            for r in self.entry.replacements
-                        ]
                         # Format decoded text with decoded portions highlighted in green
                         formatted_decoded = format_decoded_text_with_highlights(
                             self.entry.decoded,
                             self.entry.original,
-                            replacements
+                            self.replacements
                         )
                         yield Static(formatted_decoded, classes="content-area")
             
@@ -301,10 +336,9 @@ class DeleteConfirmScreen(ModalScreen):
         Binding("escape", "cancel", "Cancel"),
     ]
     
-    def __init__(self, entry, parent_screen):
+    def __init__(self, entry):
         super().__init__()
         self.entry = entry
-        self.parent_screen = parent_screen
     
     def compose(self) -> ComposeResult:
         """Create confirmation dialog."""
@@ -323,14 +357,10 @@ class DeleteConfirmScreen(ModalScreen):
     
     def action_confirm_delete(self) -> None:
         """Confirm and delete the entry."""
-        delete_history_entry(self.entry)
-        # Close the dialog
-        self.app.pop_screen()
-        # Refresh the history screen
-        self.app.pop_screen()
-        self.app.push_screen(HistoryScreen())
+        # Close the dialog; the history screen's callback updates its table in place
+        self.dismiss(delete_history_entry(self.entry))
     
     def action_cancel(self) -> None:
         """Cancel and return to history screen."""
-        self.app.pop_screen()
+        self.dismiss(False)
 
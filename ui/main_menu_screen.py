@@ -11,6 +11,14 @@ from ui.constants import TALOS_TITLE_LINES
 # Import screens here to avoid circular imports
 # These will be imported when needed in the action methods
 
+# The banner is built from constants only, so lay it out once at import time
+# instead of on every compose of the main menu
+_TALOS_BANNER = create_aligned_banner(
+    title_lines=TALOS_TITLE_LINES,
+    subtitle="Hex Byte Decoder & Text Converter\nFor The Talos Principle Game",
+    width=75
+)
+
 
 class MainMenuScreen(Screen):
     """Main menu screen."""
@@ -59,15 +67,8 @@ class MainMenuScreen(Screen):
         """Create child widgets."""
         history_count = get_history_count()
         
-        # Create banner
-        talos_banner = create_aligned_banner(
-            title_lines=TALOS_TITLE_LINES,
-            subtitle="Hex Byte Decoder & Text Converter\nFor The Talos Principle Game",
-            width=75
-        )
-        
         with Container(classes="banner-container"):
-            yield Static(talos_banner, classes="banner-container")
+            yield Static(_TALOS_BANNER, classes="banner-container")
             if history_count > 0:
                 yield Static(f"[cyan]You have {history_count} entry(ies) in your history![/cyan]", classes="banner-container")
         
@@ -94,14 +95,6 @@ class MainMenuScreen(Screen):
     
     def action_decode(self) -> None:
         """Open decode screen."""
-        import os
-        import sys
-        # Force reload by importing directly from file path
-        decode_screen_path = os.path.join(os.path.dirname(__file__), "decode_screen.py")
-        if os.path.exists(decode_screen_path):
-            # Clear any cached imports
-            if 'ui.decode_screen' in sys.modules:
-                del sys.modules['ui.decode_screen']
         from ui.decode_screen import DecodeScreen
         self.app.push_screen(DecodeScreen())
     